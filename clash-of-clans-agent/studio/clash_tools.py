@@ -0,0 +1,96 @@
+import os
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+from typing import Dict, Any
+from functools import lru_cache
+from urllib.parse import quote
+
+load_dotenv("/Users/paddy/Documents/Github/Dump-Truck/clash-of-clans-agent/.env")
+
+BASE_URL = "https://api.clashofclans.com/v1"
+TOKEN = os.getenv("CLASH_API_TOKEN")
+
+# Shared HTTP session so keep-alive reuses the TLS connection across tool calls.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    ),
+)
+_SESSION.headers.update({
+    "Authorization": f"Bearer {TOKEN}",
+    "Accept": "application/json"
+})
+
+
+def _validate_tag(tag: str) -> None:
+    """Reject malformed tags before spending a round trip on an API 400."""
+    if not tag.startswith("#") or len(tag) < 3:
+        raise ValueError(f"Invalid tag {tag!r}: tags start with '#' (e.g., \"#2YGRG9JCU\")")
+
+
+@lru_cache(maxsize=512)
+def _enc(tag: str) -> str:
+    """URL-encode a clan or player tag (e.g., "#2YGRG9JCU" -> "%232YGRG9JCU")."""
+    return quote(tag, safe="")
+
+
+def get_clan_details(clan_tag: str) -> Dict[str, Any]:
+    """
+    Fetch clan information by clan tag.
+    
+    Args:
+        clan_tag (str): Clan tag (e.g., "#2YGRG9JCU")
+    
+    Returns:
+        Dict[str, Any]: Clan information from the Clash of Clans API
+    
+    Raises:
+        ValueError: If the tag is malformed (missing "#" or too short)
+        Exception: If API request fails (non-200 status code)
+    """
+    _validate_tag(clan_tag)
+    encoded_tag = _enc(clan_tag)
+    
+    response = _SESSION.get(f"{BASE_URL}/clans/{encoded_tag}")
+    
+    if response.status_code != 200:
+        raise Exception(f"API Error {response.status_code}: {response.text}")
+    
+    return orjson.loads(response.content)
+
+
+def get_player_details(player_tag: str) -> Dict[str, Any]:
+    """
+    Fetch player information by player tag.
+    
+    Args:
+        player_tag (str): Player tag (e.g., "#ABC123")
+    
+    Returns:
+        Dict[str, Any]: Player information from the Clash of Clans API
+    
+    Raises:
+        ValueError: If the tag is malformed (missing "#" or too short)
+        Exception: If API request fails (non-200 status code)
+    """
+    _validate_tag(player_tag)
+    encoded_tag = _enc(player_tag)
+    
+    response = _SESSION.get(f"{BASE_URL}/players/{encoded_tag}")
+    
+    if response.status_code != 200:
+        raise Exception(f"API Error {response.status_code}: {response.text}")
+    
+    return orjson.loads(response.content)
\ No newline at end of file
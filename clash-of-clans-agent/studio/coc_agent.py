@@ -1,7 +1,5 @@
 import os
 import sys
-import requests
-from typing import Dict, Any
 from pprint import pprint
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
@@ -21,69 +19,15 @@ llm = ChatDeepSeek(
 )
 
 # Tool Functions
+# Add current directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) if '__file__' in globals() else os.getcwd())
 
-BASE_URL = "https://api.clashofclans.com/v1"
-TOKEN = os.getenv("CLASH_API_TOKEN")
-
-
-def get_clan_details(clan_tag: str) -> Dict[str, Any]:
-    """
-    Fetch clan information by clan tag.
-    
-    Args:
-        clan_tag (str): Clan tag (e.g., "#2YGRG9JCU")
-    
-    Returns:
-        Dict[str, Any]: Clan information from the Clash of Clans API
-    
-    Raises:
-        Exception: If API request fails (non-200 status code)
-    """
-    encoded_tag = clan_tag.replace("#", "%23")
-    
-    headers = {
-        "Authorization": f"Bearer {TOKEN}",
-        "Accept": "application/json"
-    }
-    
-    response = requests.get(f"{BASE_URL}/clans/{encoded_tag}", headers=headers)
-    
-    if response.status_code != 200:
-        raise Exception(f"API Error {response.status_code}: {response.text}")
-    
-    return response.json()
-
-
-def get_player_details(player_tag: str) -> Dict[str, Any]:
-    """
-    Fetch player information by player tag.
-    
-    Args:
-        player_tag (str): Player tag (e.g., "#ABC123")
-    
-    Returns:
-        Dict[str, Any]: Player information from the Clash of Clans API
-    
-    Raises:
-        Exception: If API request fails (non-200 status code)
-    """
-    encoded_tag = player_tag.replace("#", "%23")
-    
-    headers = {
-        "Authorization": f"Bearer {TOKEN}",
-        "Accept": "application/json"
-    }
-    
-    response = requests.get(f"{BASE_URL}/players/{encoded_tag}", headers=headers)
-    
-    if response.status_code != 200:
-        raise Exception(f"API Error {response.status_code}: {response.text}")
-    
-    return response.json()
+from clash_tools import get_clan_details, get_player_details  # type: ignore
 
 
+# Tuple keeps the tool set immutable.
+tools = (get_clan_details, get_player_details)
 
-tools = [get_clan_details, get_player_details]
 llm_with_tools = llm.bind_tools(tools, parallel_tool_calls=True)
 
 
@@ -10,71 +10,99 @@ print(os.getcwd())
 
 load_dotenv("/Users/paddy/Documents/Github/Dump-Truck/last-fm-spotify-agent/.env")
 
-import os
-from arize.otel import register as arize_register
-from openinference.instrumentation.langchain import LangChainInstrumentor
-from opentelemetry import trace as trace_api
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from phoenix.otel import HTTPSpanExporter
-
-PHOENIX_COLLECTOR = "https://app.phoenix.arize.com/s/padmanabhan-rajendra/v1/traces"
-PHOENIX_API_KEY = os.environ.get("PHOENIX_API_KEY")
-
-# 1) Arize tracer provider + its default exporter
-tracer_provider = arize_register(
-    space_id=os.environ["ARIZE_SPACE_ID"],
-    api_key=os.environ["ARIZE_API_KEY"],
-    project_name="lastfm-spotify-app",
-)
-
-# 2) Add Phoenix exporter as an additional span processor
-phoenix_exporter = HTTPSpanExporter(
-    endpoint=PHOENIX_COLLECTOR,
-    headers={"authorization": f"Bearer {PHOENIX_API_KEY}"},
-)
-phoenix_processor = BatchSpanProcessor(phoenix_exporter)
-
-# Add the Phoenix processor to the existing tracer provider
-tracer_provider.add_span_processor(phoenix_processor)
-
-# If you ALSO want a local Phoenix target, you can add it:
-local_exporter = HTTPSpanExporter(endpoint="http://127.0.0.1:6006/v1/traces")
-local_processor = BatchSpanProcessor(local_exporter)
-tracer_provider.add_span_processor(local_processor)
-
-# 3) Set global + instrument LangChain
-trace_api.set_tracer_provider(tracer_provider)
-LangChainInstrumentor().instrument(tracer_provider=tracer_provider)
-
-print("LangChain instrumented → Arize + Phoenix (SaaS [+ local if enabled])")
+from functools import lru_cache
 
 from langchain_core.messages import SystemMessage
 
-# from langchain_ollama import ChatOllama
-# llm = ChatOllama(
-#     model="qwen2.5-coder:7b",
-#     temperature=0,
-# )
-
-# Previous options commented out
-# from langchain_google_genai import ChatGoogleGenerativeAI
-# llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0)
-
-# from langchain_groq import ChatGroq
-# llm = ChatGroq(model="openai/gpt-oss-120b", temperature=0)
-
-from langchain_deepseek import ChatDeepSeek
-llm = ChatDeepSeek(
-    model="deepseek/deepseek-v3.2",
-    api_key=os.getenv("OPENROUTER_API_KEY"),
-    api_base="https://openrouter.ai/api/v1",
-    # extra_body={"reasoning": {"enabled": True}},
-)
+PHOENIX_COLLECTOR = "https://app.phoenix.arize.com/s/padmanabhan-rajendra/v1/traces"
+
+# Tracing and LLM client imports are deferred: they pull in large dependency
+# trees and instrumentation side effects, so importing this module stays cheap
+# unless Arize tracing is configured.
+_tracing_initialized = False
+
+
+def _init_tracing():
+    """Register Arize + Phoenix exporters and instrument LangChain (once)."""
+    global _tracing_initialized
+    if _tracing_initialized:
+        return
+
+    # Mark as done even if a step fails, so a retry never stacks duplicate
+    # span processors onto the provider.
+    try:
+        from arize.otel import register as arize_register
+        from openinference.instrumentation.langchain import LangChainInstrumentor
+        from opentelemetry import trace as trace_api
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from phoenix.otel import HTTPSpanExporter
+
+        PHOENIX_API_KEY = os.environ.get("PHOENIX_API_KEY")
+
+        # 1) Arize tracer provider + its default exporter
+        tracer_provider = arize_register(
+            space_id=os.environ["ARIZE_SPACE_ID"],
+            api_key=os.environ["ARIZE_API_KEY"],
+            project_name="lastfm-spotify-app",
+        )
+
+        # 2) Add Phoenix exporter as an additional span processor
+        phoenix_exporter = HTTPSpanExporter(
+            endpoint=PHOENIX_COLLECTOR,
+            headers={"authorization": f"Bearer {PHOENIX_API_KEY}"},
+        )
+        phoenix_processor = BatchSpanProcessor(phoenix_exporter)
+
+        # Add the Phoenix processor to the existing tracer provider
+        tracer_provider.add_span_processor(phoenix_processor)
+
+        # If you ALSO want a local Phoenix target, you can add it:
+        local_exporter = HTTPSpanExporter(endpoint="http://127.0.0.1:6006/v1/traces")
+        local_processor = BatchSpanProcessor(local_exporter)
+        tracer_provider.add_span_processor(local_processor)
+
+        # 3) Set global + instrument LangChain
+        trace_api.set_tracer_provider(tracer_provider)
+        LangChainInstrumentor().instrument(tracer_provider=tracer_provider)
+    finally:
+        _tracing_initialized = True
+    print("LangChain instrumented → Arize + Phoenix (SaaS [+ local if enabled])")
+
+
+# Instrument once, before the graph first runs, and only when Arize is configured.
+if os.getenv("ARIZE_SPACE_ID"):
+    _init_tracing()
+
+
+@lru_cache(maxsize=1)
+def get_llm():
+    """Build the chat model on first use."""
+    # from langchain_ollama import ChatOllama
+    # return ChatOllama(
+    #     model="qwen2.5-coder:7b",
+    #     temperature=0,
+    # )
+
+    # Previous options commented out
+    # from langchain_google_genai import ChatGoogleGenerativeAI
+    # return ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0)
+
+    # from langchain_groq import ChatGroq
+    # return ChatGroq(model="openai/gpt-oss-120b", temperature=0)
+
+    from langchain_deepseek import ChatDeepSeek
+    return ChatDeepSeek(
+        model="deepseek/deepseek-v3.2",
+        api_key=os.getenv("OPENROUTER_API_KEY"),
+        api_base="https://openrouter.ai/api/v1",
+        # extra_body={"reasoning": {"enabled": True}},
+    )
 
 from lastfm_spotify_tools import (  # type: ignore
     get_artist_albums,
     get_artist_details,
     get_artist_details_by_name,
+    get_artist_details_by_names,
     get_artist_info,
     get_artist_top_tracks,
     get_lastfm_user_info,
@@ -84,7 +112,8 @@ from lastfm_spotify_tools import (  # type: ignore
     search_artists_by_genre,
 )
 
-tools = [
+# Tuple keeps the tool set immutable so the bound LLM can be cached.
+tools = (
     get_lastfm_user_info,
     get_lastfm_user_top_artists,
     get_artist_info,
@@ -93,11 +122,18 @@ tools = [
     search_artist_by_name,
     get_artist_details,
     get_artist_details_by_name,
+    get_artist_details_by_names,
     get_artist_top_tracks,
     get_artist_albums,
-]
-# Note: parallel_tool_calls parameter not supported by ChatOllama
-llm_with_tools = llm.bind_tools(tools, parallel_tool_calls=True)
+)
+
+
+@lru_cache(maxsize=1)
+def _llm_with_tools():
+    """Bind the tools to the chat model on first use."""
+    # Note: parallel_tool_calls parameter not supported by ChatOllama
+    return get_llm().bind_tools(tools, parallel_tool_calls=True)
+
 
 from langgraph.graph import START, MessagesState, StateGraph
 from langgraph.prebuilt import ToolNode, tools_condition
@@ -119,6 +155,7 @@ Spotify tools:
 - search_artist_by_name: Search for artists by name (returns list of matches)
 - get_artist_details: Get detailed artist information by Spotify ID (includes followers, popularity, genres)
 - get_artist_details_by_name: Get detailed artist information by name (convenience function that searches and returns top match)
+- get_artist_details_by_names: Get detailed artist information for several artists by name in one call
 - get_artist_top_tracks: Get an artist's top tracks for a specific market
 - get_artist_albums: Get an artist's albums and releases
 
@@ -127,15 +164,16 @@ Guidelines:
 - Use Last.fm for listening history, scrobble data, and user-specific top artists
 - Use Spotify for genre searches, artist discovery, detailed track/album info, and artist statistics (followers, popularity)
 - When users ask about artist stats by name, use get_artist_details_by_name for convenience
+- When comparing several artists by name, use get_artist_details_by_names instead of repeated single lookups
 - Provide clear, helpful responses based on the tool results
 """
 
 sys_msg = SystemMessage(content=LASTFM_SPOTIFY_SYSTEM_PROMPT)
 
-def music_assistant(state: MessagesState):
+async def music_assistant(state: MessagesState):
     return {
         "messages": [
-            llm_with_tools.invoke([sys_msg] + state["messages"])
+            await _llm_with_tools().ainvoke([sys_msg] + state["messages"])
         ]
     }
 
@@ -1,8 +1,13 @@
+import asyncio
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
-
-import requests
+import tempfile
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
 from dotenv import load_dotenv
 
 # Load environment variables once when the module is imported.
@@ -11,21 +16,233 @@ load_dotenv()
 # Last.fm configuration
 LASTFM_BASE_URL: str = "https://ws.audioscrobbler.com/2.0"
 LASTFM_API_KEY: Optional[str] = os.getenv("LASTFM_API_KEY")
+_LASTFM_BASE_PARAMS: Dict[str, Any] = {
+    "api_key": LASTFM_API_KEY,
+    "format": "json",
+}
 
 # Spotify configuration
 SPOTIFY_CLIENT_ID: Optional[str] = os.getenv("SPOTIFY_CLIENT_ID")
 SPOTIFY_CLIENT_SECRET: Optional[str] = os.getenv("SPOTIFY_CLIENT_SECRET")
+_SPOTIFY_V1: str = "https://api.spotify.com/v1"
 
-# Token cache for Spotify (internal use).
+# Token cache for Spotify (internal use). _SPOTIFY_HEADERS is rebuilt only
+# when the token is refreshed, not on every request.
 _spotify_token_cache: Optional[Dict[str, Any]] = None
+_SPOTIFY_HEADERS: Dict[str, str] = {"Authorization": ""}
+
+# On-disk copy of the Spotify token so a fresh process can reuse it. Expiry is
+# stored as a wall-clock epoch since monotonic time does not survive restarts.
+_SPOTIFY_TOKEN_FILE: str = os.path.join(
+    os.path.expanduser("~"), ".cache", "dumptruck", "spotify_token.json"
+)
+
+# Response caches (internal use). Searches and Last.fm lookups use a short TTL;
+# Spotify resources addressed by artist ID change rarely and live longer.
+# _stale_cache keeps the last good payload per key as a fallback on failures.
+_short_cache: TTLCache = TTLCache(maxsize=1024, ttl=120)
+_long_cache: TTLCache = TTLCache(maxsize=1024, ttl=600)
+_stale_cache: LRUCache = LRUCache(maxsize=1024)
+
+# Maximum concurrent lookups issued by get_artist_details_by_names.
+_BATCH_CONCURRENCY: int = 8
+
+# Per-API circuit breakers (internal use). After _BREAKER_THRESHOLD consecutive
+# 429/5xx responses or transport errors, requests to that API fail fast for
+# _BREAKER_COOLDOWN seconds; _cached then serves stale data where it can.
+_BREAKER_THRESHOLD: int = 3
+_BREAKER_COOLDOWN: float = 30.0
+_breaker: Dict[str, Dict[str, float]] = {
+    "lastfm": {"fail": 0, "open_until": 0.0},
+    "spotify": {"fail": 0, "open_until": 0.0},
+}
+
+# Per-event-loop state (internal use): the shared HTTP/2 clients, the token
+# refresh lock, and the map of requests currently on the wire. httpx clients,
+# locks, and tasks are bound to the loop that first uses them, so each running
+# loop gets its own set; entries go away when their loop is garbage collected.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+_loop_state: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _clients() -> Dict[str, Any]:
+    """
+    Return the client state for the running event loop, creating it on first use.
+
+    The Spotify and Last.fm clients use HTTP/2, so concurrent requests to the
+    same host are multiplexed over one connection instead of one socket each.
+
+    Returns:
+        A dict with "spotify" and "lastfm" httpx.AsyncClient instances, the
+        "token_lock" asyncio.Lock, and the "inflight" request map.
+    """
+    loop = asyncio.get_running_loop()
+    state = _loop_state.get(loop)
+    if state is None:
+        state = {
+            "spotify": httpx.AsyncClient(
+                base_url=_SPOTIFY_V1,
+                http2=True,
+                limits=_HTTP_LIMITS,
+                timeout=10.0,
+            ),
+            "lastfm": httpx.AsyncClient(
+                base_url=LASTFM_BASE_URL,
+                params=_LASTFM_BASE_PARAMS,
+                http2=True,
+                limits=_HTTP_LIMITS,
+                timeout=10.0,
+            ),
+            "token_lock": asyncio.Lock(),
+            "inflight": {},
+        }
+        _loop_state[loop] = state
+    return state
+
+
+async def aclose_clients() -> None:
+    """
+    Close the HTTP clients created for the running event loop.
+
+    Call this before the loop shuts down (e.g., at the end of a script that
+    uses asyncio.run) to release pooled connections cleanly. A later call on
+    the same loop creates fresh clients.
+    """
+    state = _loop_state.pop(asyncio.get_running_loop(), None)
+    if state is not None:
+        await state["spotify"].aclose()
+        await state["lastfm"].aclose()
+
+
+def _cache_key(endpoint: str, params: Optional[Dict[str, Any]]) -> Hashable:
+    """Build a hashable cache key from an endpoint and its query parameters."""
+    return (endpoint, tuple(sorted((params or {}).items())))
+
+
+def _forget_inflight(
+    inflight: Dict[Hashable, "asyncio.Future[Dict[str, Any]]"],
+    key: Hashable,
+    task: "asyncio.Future[Dict[str, Any]]",
+) -> None:
+    """Drop a finished request from the in-flight map and mark its error as seen."""
+    inflight.pop(key, None)
+    if not task.cancelled():
+        task.exception()
+
+
+async def _cached(
+    cache: TTLCache,
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """
+    Return a cached response for key, fetching and storing it on a miss.
+
+    Lookups go cache -> in-flight -> network: if an identical request is
+    already running, its result is awaited instead of issuing a duplicate.
+    If the fetch raises and an earlier response for the same key is still in
+    the stale cache, that response is returned instead of the error.
+
+    Args:
+        cache:
+            The TTL cache to read from and store into.
+        key:
+            Cache key built by _cache_key.
+        fetch:
+            Zero-argument coroutine function that performs the request.
+
+    Returns:
+        The decoded JSON response as a dictionary.
+
+    Raises:
+        Exception: If the fetch fails and no stale response is available.
+    """
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    inflight = _clients()["inflight"]
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight[key] = task
+        task.add_done_callback(lambda done: _forget_inflight(inflight, key, done))
+
+    try:
+        # Shield so one cancelled caller does not cancel the shared request.
+        data = await asyncio.shield(task)
+    except Exception:
+        stale = _stale_cache.get(key)
+        if stale is None:
+            raise
+        return stale
+
+    cache[key] = data
+    _stale_cache[key] = data
+    return data
+
+
+def _check_breaker(service: str) -> None:
+    """Raise immediately if the circuit breaker for service is open."""
+    open_until = _breaker[service]["open_until"]
+    if time.monotonic() < open_until:
+        raise Exception(
+            f"{service} circuit open after repeated failures; "
+            f"retrying in {open_until - time.monotonic():.0f}s."
+        )
+
+
+async def _guarded(
+    service: str, send: Callable[[], Awaitable[httpx.Response]]
+) -> httpx.Response:
+    """
+    Send a request through the circuit breaker for service.
+
+    Args:
+        service:
+            Breaker name, "lastfm" or "spotify".
+        send:
+            Zero-argument coroutine function that performs the request.
+
+    Returns:
+        The HTTP response. Rate-limit and server errors are returned as-is
+        for the caller to report, but count towards opening the breaker.
+
+    Raises:
+        Exception: If the breaker is open; the request is not sent.
+        httpx.TransportError: If the request fails at the transport level.
+    """
+    _check_breaker(service)
+
+    state = _breaker[service]
+    try:
+        response = await send()
+    except httpx.TransportError:
+        _record_failure(state)
+        raise
+
+    if response.status_code == 429 or response.status_code >= 500:
+        _record_failure(state)
+    else:
+        state["fail"] = 0
+    return response
+
+
+def _record_failure(state: Dict[str, float]) -> None:
+    """Count a failure and open the breaker once the threshold is reached."""
+    state["fail"] += 1
+    if state["fail"] >= _BREAKER_THRESHOLD:
+        state["open_until"] = time.monotonic() + _BREAKER_COOLDOWN
 
 
-def _lastfm_get(params: Dict[str, Any]) -> Dict[str, Any]:
+async def _lastfm_get(params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Call a Last.fm API method and return the JSON response.
 
     This helper automatically adds the API key and JSON format, and raises on
-    HTTP errors or explicit Last.fm API errors.
+    HTTP errors or explicit Last.fm API errors. Responses are cached briefly.
 
     Args:
         params:
@@ -42,27 +259,127 @@ def _lastfm_get(params: Dict[str, Any]) -> Dict[str, Any]:
     if not LASTFM_API_KEY:
         raise Exception("LASTFM_API_KEY environment variable is not set.")
 
-    base_params: Dict[str, Any] = {
-        "api_key": LASTFM_API_KEY,
-        "format": "json",
-    }
+    return await _cached(
+        _short_cache,
+        _cache_key("lastfm", params),
+        lambda: _lastfm_fetch(params),
+    )
 
-    response = requests.get(LASTFM_BASE_URL, params={**base_params, **params})
+
+async def _lastfm_fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Perform an uncached Last.fm API request (see _lastfm_get)."""
+    response = await _guarded(
+        "lastfm", lambda: _clients()["lastfm"].get("/", params=params)
+    )
     if response.status_code != 200:
         raise Exception(f"Last.fm HTTP {response.status_code}: {response.text}")
 
-    data: Dict[str, Any] = response.json()
+    data: Dict[str, Any] = orjson.loads(response.content)
     if "error" in data:
         raise Exception(f"Last.fm error {data.get('error')}: {data.get('message')}")
     return data
 
 
-def _get_spotify_token() -> str:
+def _set_spotify_token(token: str, expires_in: float) -> None:
+    """Store a token in the in-memory cache and the shared request headers."""
+    global _spotify_token_cache
+
+    _spotify_token_cache = {
+        "token": token,
+        "expires_at": time.monotonic() + expires_in,
+    }
+    _SPOTIFY_HEADERS["Authorization"] = f"Bearer {token}"
+
+
+def _load_disk_token() -> Optional[Dict[str, Any]]:
+    """
+    Read the persisted Spotify token, if present and not yet expired.
+
+    Returns:
+        A dict with "token" and remaining "expires_in" seconds, or None if the
+        file is missing, unreadable, malformed, expired, or was issued for a
+        different SPOTIFY_CLIENT_ID.
+    """
+    try:
+        with open(_SPOTIFY_TOKEN_FILE, "rb") as f:
+            data = orjson.loads(f.read())
+        expires_in = float(data["expires_at_epoch"]) - time.time()
+        token = data["token"]
+        client_id = data.get("client_id")
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+    if expires_in <= 0 or client_id != SPOTIFY_CLIENT_ID:
+        return None
+    return {"token": token, "expires_in": expires_in}
+
+
+def _save_disk_token(token: str, expires_in: float) -> None:
+    """
+    Persist the Spotify token atomically, ignoring filesystem errors.
+
+    The file is written to a temporary path in the same directory and moved
+    into place with os.replace, so readers never see a partial file.
+    """
+    directory = os.path.dirname(_SPOTIFY_TOKEN_FILE)
+    payload = orjson.dumps(
+        {
+            "token": token,
+            "client_id": SPOTIFY_CLIENT_ID,
+            "expires_at_epoch": time.time() + expires_in,
+        }
+    )
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, _SPOTIFY_TOKEN_FILE)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _remove_disk_token() -> None:
+    """Delete the persisted Spotify token, ignoring filesystem errors."""
+    try:
+        os.remove(_SPOTIFY_TOKEN_FILE)
+    except OSError:
+        pass
+
+
+async def _invalidate_spotify_token(token: str) -> None:
+    """
+    Drop a token Spotify rejected from memory and disk.
+
+    Only the given token is discarded: if another coroutine has already
+    replaced it, the newer token is kept.
+    """
+    global _spotify_token_cache
+
+    async with _clients()["token_lock"]:
+        if not _spotify_token_cache or _spotify_token_cache["token"] != token:
+            return
+        _spotify_token_cache = None
+        _SPOTIFY_HEADERS["Authorization"] = ""
+        try:
+            await asyncio.to_thread(_remove_disk_token)
+        except Exception:
+            pass
+
+
+async def _get_spotify_token() -> str:
     """
     Obtain a Spotify access token using the client credentials flow.
 
     Tokens are cached in memory until shortly before they expire, so repeated
-    calls reuse an existing token when possible.
+    calls reuse an existing token when possible. Tokens are also persisted
+    under ~/.cache/dumptruck, so a new process can skip the token request.
+    Refreshes are serialized by a lock, so concurrent callers that miss the
+    cache share a single request.
 
     Returns:
         A bearer token string for use with Spotify Web API requests.
@@ -71,43 +388,59 @@ def _get_spotify_token() -> str:
         Exception: If Spotify client credentials are missing or the token
         request fails.
     """
-    global _spotify_token_cache
-
     if not SPOTIFY_CLIENT_ID or not SPOTIFY_CLIENT_SECRET:
         raise Exception(
             "Spotify credentials are not configured. "
             "Set SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET."
         )
 
-    if _spotify_token_cache and _spotify_token_cache["expires_at"] > datetime.now():
+    if _spotify_token_cache and _spotify_token_cache["expires_at"] > time.monotonic():
         return _spotify_token_cache["token"]
 
-    auth_url = "https://accounts.spotify.com/api/token"
-    auth_data = {
-        "grant_type": "client_credentials",
-        "client_id": SPOTIFY_CLIENT_ID,
-        "client_secret": SPOTIFY_CLIENT_SECRET,
-    }
+    async with _clients()["token_lock"]:
+        # Another coroutine may have refreshed the token while we waited.
+        if _spotify_token_cache and _spotify_token_cache["expires_at"] > time.monotonic():
+            return _spotify_token_cache["token"]
+
+        # File I/O runs in a worker thread to keep the event loop unblocked.
+        # The disk copy is only a shortcut: on any error, request a new token.
+        try:
+            disk_token = await asyncio.to_thread(_load_disk_token)
+        except Exception:
+            disk_token = None
+        if disk_token is not None:
+            _set_spotify_token(disk_token["token"], disk_token["expires_in"])
+            return disk_token["token"]
+
+        auth_url = "https://accounts.spotify.com/api/token"
+        auth_data = {
+            "grant_type": "client_credentials",
+            "client_id": SPOTIFY_CLIENT_ID,
+            "client_secret": SPOTIFY_CLIENT_SECRET,
+        }
 
-    response = requests.post(auth_url, data=auth_data)
-    if response.status_code != 200:
-        raise Exception(f"Spotify auth failed: {response.text}")
+        response = await _clients()["spotify"].post(auth_url, data=auth_data)
+        if response.status_code != 200:
+            raise Exception(f"Spotify auth failed: {response.text}")
 
-    token_data: Dict[str, Any] = response.json()
-    expires_in: int = int(token_data.get("expires_in", 3600))
+        token_data: Dict[str, Any] = orjson.loads(response.content)
+        expires_in: int = int(token_data.get("expires_in", 3600))
+        token: str = token_data["access_token"]
 
-    _spotify_token_cache = {
-        "token": token_data["access_token"],
-        "expires_at": datetime.now() + timedelta(seconds=expires_in - 60),
-    }
-    return _spotify_token_cache["token"]
+        _set_spotify_token(token, expires_in - 60)
+        try:
+            await asyncio.to_thread(_save_disk_token, token, expires_in - 60)
+        except Exception:
+            pass
+        return token
 
 
-def _spotify_get(endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+async def _spotify_get(endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Call a Spotify Web API endpoint and return the JSON response.
 
-    This helper attaches a bearer token and raises on HTTP errors.
+    This helper attaches a bearer token and raises on HTTP errors. Responses
+    are cached; "/artists/..." resources use a longer TTL than searches.
 
     Args:
         endpoint:
@@ -122,17 +455,77 @@ def _spotify_get(endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict
         Exception: If acquiring a token fails or the HTTP request is not
         successful.
     """
-    token = _get_spotify_token()
-    headers = {"Authorization": f"Bearer {token}"}
-
-    response = requests.get(
-        f"https://api.spotify.com/v1{endpoint}",
-        headers=headers,
-        params=params,
+    cache = _long_cache if endpoint.startswith("/artists/") else _short_cache
+    return await _cached(
+        cache,
+        _cache_key(endpoint, params),
+        lambda: _spotify_fetch(endpoint, params),
     )
+
+
+async def _spotify_fetch(
+    endpoint: str, params: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Perform an uncached Spotify Web API request (see _spotify_get)."""
+    # Check before the token refresh so an open breaker fails fast.
+    _check_breaker("spotify")
+
+    # A 401 means the token was revoked or the persisted copy is stale:
+    # discard it and retry once with a fresh one.
+    for attempt in range(2):
+        token = await _get_spotify_token()
+        response = await _guarded(
+            "spotify",
+            lambda: _clients()["spotify"].get(
+                endpoint,
+                headers=_SPOTIFY_HEADERS,
+                params=params,
+            ),
+        )
+        if response.status_code != 401 or attempt:
+            break
+        await _invalidate_spotify_token(token)
+
     if response.status_code != 200:
         raise Exception(f"Spotify HTTP {response.status_code}: {response.text}")
-    return response.json()
+    return orjson.loads(response.content)
+
+
+# ---------------------------------------------------------------------------
+# Response projections
+# ---------------------------------------------------------------------------
+# Tool results are fed back to the LLM, so the public functions below drop
+# fields the model never uses (markets, image sets, URLs). These helpers build
+# new dicts rather than mutating payloads, which may be shared via the cache.
+
+_ALBUM_DROP_KEYS = frozenset({"available_markets", "external_urls", "images"})
+
+
+def _project_track(track: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the track fields the assistant reports on."""
+    return {
+        "name": track.get("name"),
+        "popularity": track.get("popularity"),
+        "id": track.get("id"),
+        "album": {"name": track.get("album", {}).get("name")},
+        "duration_ms": track.get("duration_ms"),
+    }
+
+
+def _project_album(album: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop markets and URLs from an album, keeping at most one image."""
+    projected = {k: v for k, v in album.items() if k not in _ALBUM_DROP_KEYS}
+    projected["images"] = album.get("images", [])[:1]
+    return projected
+
+
+def _project_lastfm_artist(artist: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the name, playcount and MBID of a Last.fm artist."""
+    return {
+        "name": artist.get("name"),
+        "playcount": artist.get("playcount"),
+        "mbid": artist.get("mbid"),
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -140,7 +533,7 @@ def _spotify_get(endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict
 # ---------------------------------------------------------------------------
 
 
-def get_lastfm_user_info(username: str) -> Dict[str, Any]:
+async def get_lastfm_user_info(username: str) -> Dict[str, Any]:
     """
     Get public profile information for a Last.fm user.
 
@@ -156,10 +549,10 @@ def get_lastfm_user_info(username: str) -> Dict[str, Any]:
     Raises:
         Exception: If the request fails or Last.fm returns an error.
     """
-    return _lastfm_get({"method": "user.getInfo", "user": username})
+    return await _lastfm_get({"method": "user.getInfo", "user": username})
 
 
-def get_artist_info(artist_name: str) -> Dict[str, Any]:
+async def get_artist_info(artist_name: str) -> Dict[str, Any]:
     """
     Get metadata for an artist from Last.fm.
 
@@ -175,10 +568,10 @@ def get_artist_info(artist_name: str) -> Dict[str, Any]:
     Raises:
         Exception: If the request fails or Last.fm returns an error.
     """
-    return _lastfm_get({"method": "artist.getInfo", "artist": artist_name})
+    return await _lastfm_get({"method": "artist.getInfo", "artist": artist_name})
 
 
-def get_track_info(artist_name: str, track_name: str) -> Dict[str, Any]:
+async def get_track_info(artist_name: str, track_name: str) -> Dict[str, Any]:
     """
     Get metadata for a track from Last.fm.
 
@@ -196,7 +589,7 @@ def get_track_info(artist_name: str, track_name: str) -> Dict[str, Any]:
     Raises:
         Exception: If the request fails or Last.fm returns an error.
     """
-    return _lastfm_get(
+    return await _lastfm_get(
         {
             "method": "track.getInfo",
             "artist": artist_name,
@@ -204,7 +597,7 @@ def get_track_info(artist_name: str, track_name: str) -> Dict[str, Any]:
         }
     )
 
-def get_lastfm_user_top_artists(
+async def get_lastfm_user_top_artists(
     username: str,
     period: str = "overall",
     limit: int = 50,
@@ -226,12 +619,13 @@ def get_lastfm_user_top_artists(
             Page number to fetch. Defaults to 1.
 
     Returns:
-        The Last.fm JSON response containing top artists with playcount.
+        The Last.fm top artists response, with each artist reduced to its
+        name, playcount, and MBID. Paging info is kept under "@attr".
 
     Raises:
         Exception: If the request fails or Last.fm returns an error.
     """
-    return _lastfm_get(
+    data = await _lastfm_get(
         {
             "method": "user.getTopArtists",
             "user": username,
@@ -240,6 +634,13 @@ def get_lastfm_user_top_artists(
             "page": page,
         }
     )
+    top_artists = data.get("topartists", {})
+    return {
+        "topartists": {
+            "artist": [_project_lastfm_artist(a) for a in top_artists.get("artist", [])],
+            "@attr": top_artists.get("@attr", {}),
+        }
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -247,7 +648,7 @@ def get_lastfm_user_top_artists(
 # ---------------------------------------------------------------------------
 
 
-def search_artists_by_genre(genre: str, limit: int = 20) -> Dict[str, Any]:
+async def search_artists_by_genre(genre: str, limit: int = 20) -> Dict[str, Any]:
     """
     Search for Spotify artists associated with a given genre.
 
@@ -265,7 +666,7 @@ def search_artists_by_genre(genre: str, limit: int = 20) -> Dict[str, Any]:
     Raises:
         Exception: If token acquisition or the HTTP request fails.
     """
-    return _spotify_get(
+    return await _spotify_get(
         "/search",
         {
             "q": f'genre:"{genre}"',
@@ -275,7 +676,7 @@ def search_artists_by_genre(genre: str, limit: int = 20) -> Dict[str, Any]:
     )
 
 
-def get_artist_details(artist_id: str) -> Dict[str, Any]:
+async def get_artist_details(artist_id: str) -> Dict[str, Any]:
     """
     Get detailed information for a Spotify artist by ID.
 
@@ -291,10 +692,10 @@ def get_artist_details(artist_id: str) -> Dict[str, Any]:
     Raises:
         Exception: If token acquisition or the HTTP request fails.
     """
-    return _spotify_get(f"/artists/{artist_id}")
+    return await _spotify_get(f"/artists/{artist_id}")
 
 
-def get_artist_top_tracks(artist_id: str, market: str = "US") -> Dict[str, Any]:
+async def get_artist_top_tracks(artist_id: str, market: str = "US") -> Dict[str, Any]:
     """
     Get an artist's top tracks from Spotify for a given market.
 
@@ -308,18 +709,21 @@ def get_artist_top_tracks(artist_id: str, market: str = "US") -> Dict[str, Any]:
             (e.g., "US"). Defaults to "US".
 
     Returns:
-        The Spotify JSON response containing the top tracks.
+        The top tracks, each reduced to name, popularity, id, album name, and
+        duration_ms.
 
     Raises:
         Exception: If token acquisition or the HTTP request fails.
     """
-    return _spotify_get(f"/artists/{artist_id}/top-tracks", {"market": market})
+    data = await _spotify_get(f"/artists/{artist_id}/top-tracks", {"market": market})
+    return {"tracks": [_project_track(t) for t in data.get("tracks", [])]}
 
 
-def get_artist_albums(
+async def get_artist_albums(
     artist_id: str,
     limit: int = 20,
     include_groups: str = "album",
+    max_items: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Get a list of albums or releases for a Spotify artist.
@@ -334,22 +738,59 @@ def get_artist_albums(
         include_groups:
             Comma-separated album group filters (e.g., "album", "single",
             "appears_on", "compilation"). Defaults to "album".
+        max_items:
+            Optional total number of albums to return. Pages of up to `limit`
+            items are fetched by offset until this many are collected or the
+            artist has no more releases; a value below `limit` requests a
+            single smaller page. Must be at least 1. Defaults to one page of
+            `limit` items.
 
     Returns:
-        The Spotify JSON response containing the artist's releases.
+        The Spotify JSON response containing the artist's releases, with
+        available markets and external URLs removed and at most one image
+        per album. When several pages are merged, "offset" and "limit"
+        describe the combined items and "href", "next", and "previous" are
+        omitted.
 
     Raises:
+        ValueError: If max_items is less than 1.
         Exception: If token acquisition or the HTTP request fails.
     """
-    return _spotify_get(
-        f"/artists/{artist_id}/albums",
-        {
-            "limit": limit,
-            "include_groups": include_groups,
-        },
-    )
-
-def search_artist_by_name(artist_name: str, limit: int = 10) -> Dict[str, Any]:
+    if max_items is not None and max_items < 1:
+        raise ValueError(f"max_items must be at least 1, got {max_items}.")
+
+    # Spotify accepts page sizes of 1–50 and rejects anything else with a 400.
+    page_size = max(1, min(limit, max_items or limit, 50))
+    target = page_size if max_items is None else max_items
+
+    items: List[Dict[str, Any]] = []
+    offset = 0
+    pages = 0
+    while True:
+        data = await _spotify_get(
+            f"/artists/{artist_id}/albums",
+            {
+                "limit": page_size,
+                "offset": offset,
+                "include_groups": include_groups,
+            },
+        )
+        items.extend(data.get("items", []))
+        offset += page_size
+        pages += 1
+        if len(items) >= target or not data.get("next"):
+            break
+
+    result = {**data, "items": [_project_album(a) for a in items[:target]]}
+    if pages > 1:
+        # Paging fields of the last page do not describe the merged items.
+        for key in ("href", "next", "previous"):
+            result.pop(key, None)
+        result["offset"] = 0
+        result["limit"] = len(result["items"])
+    return result
+
+async def search_artist_by_name(artist_name: str, limit: int = 10) -> Dict[str, Any]:
     """
     Search for Spotify artists by name.
 
@@ -367,7 +808,7 @@ def search_artist_by_name(artist_name: str, limit: int = 10) -> Dict[str, Any]:
     Raises:
         Exception: If token acquisition or the HTTP request fails.
     """
-    return _spotify_get(
+    return await _spotify_get(
         "/search",
         {
             "q": artist_name,
@@ -377,31 +818,72 @@ def search_artist_by_name(artist_name: str, limit: int = 10) -> Dict[str, Any]:
     )
 
 
-def get_artist_details_by_name(artist_name: str) -> Optional[Dict[str, Any]]:
+async def get_artist_details_by_name(artist_name: str) -> Optional[Dict[str, Any]]:
     """
     Get detailed information for a Spotify artist by name.
 
-    This is a convenience function that searches for the artist by name,
-    selects the top match, and returns full details including followers,
-    popularity, and genres.
+    This is a convenience function that searches for the artist by name and
+    returns the top match. Artist objects in Spotify search results already
+    include followers, popularity, and genres, so no second "/artists/{id}"
+    request is made.
 
     Args:
         artist_name:
             Name of the artist (e.g., "Metallica", "Bon Jovi").
 
     Returns:
-        The Spotify JSON response with artist details (followers, popularity,
+        The Spotify artist object for the best match (followers, popularity,
         genres), or None if no artist is found.
 
     Raises:
-        Exception: If token acquisition or HTTP requests fail.
+        Exception: If token acquisition or the HTTP request fails.
     """
-    search_results = search_artist_by_name(artist_name, limit=1)
+    search_results = await search_artist_by_name(artist_name, limit=1)
     
     artists = search_results.get("artists", {}).get("items", [])
     if not artists:
         return None
     
-    # Get the first (best) match
-    artist_id = artists[0]["id"]
-    return get_artist_details(artist_id)
+    # The first (best) match already carries the artist details
+    return artists[0]
+
+
+async def get_artist_details_by_names(
+    artist_names: List[str],
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Get detailed information for several Spotify artists by name at once.
+
+    The name searches are issued concurrently, at most
+    _BATCH_CONCURRENCY at a time, so resolving several artists takes roughly
+    as long as resolving one. A failed lookup does not affect the others.
+
+    Args:
+        artist_names:
+            Names of the artists (e.g., ["Metallica", "Bon Jovi"]).
+
+    Returns:
+        A mapping from each requested name to its Spotify artist object
+        (followers, popularity, genres), None if no artist is found, or
+        {"error": "..."} if that lookup failed.
+    """
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def lookup(name: str) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            return await get_artist_details_by_name(name)
+
+    results = await asyncio.gather(
+        *(lookup(name) for name in artist_names),
+        return_exceptions=True,
+    )
+
+    artists: Dict[str, Optional[Dict[str, Any]]] = {}
+    for name, result in zip(artist_names, results):
+        if isinstance(result, Exception):
+            artists[name] = {"error": str(result)}
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            artists[name] = result
+    return artists